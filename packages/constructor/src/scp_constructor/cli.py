@@ -1,309 +1,404 @@
 """CLI for SCP Constructor."""
 
+import argparse
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
-
-import typer
-from rich.console import Console
-from rich.panel import Panel
 
 from . import __version__
-from .parser import load_scp, SCPParseError
+from .models import SCPManifest
+from .parser import load_scp, load_scp_from_content, SCPParseError
 from .scanner.local import scan_directory
-from .scanner.github import scan_github_org
-from .graph import Neo4jGraph
-from .export import export_json, export_mermaid, export_openc2, import_json
-
-app = typer.Typer(
-    name="scp",
-    help="SCP Constructor - Build architecture graphs from scp.yaml files",
-    no_args_is_help=True,
+from .export import (
+    encode_json,
+    export_json_bytes,
+    export_mermaid,
+    export_openc2,
+    import_json,
 )
-console = Console()
-
-
-@app.command()
-def scan(
-    path: Path = typer.Argument(..., help="Directory to scan for scp.yaml files"),
-    neo4j_uri: Optional[str] = typer.Option(None, "--neo4j-uri", envvar="NEO4J_URI", help="Neo4j URI"),
-    neo4j_user: Optional[str] = typer.Option(None, "--neo4j-user", envvar="NEO4J_USER", help="Neo4j username"),
-    neo4j_password: Optional[str] = typer.Option(None, "--neo4j-password", envvar="NEO4J_PASSWORD", help="Neo4j password"),
-    export_format: Optional[str] = typer.Option(None, "--export", "-e", help="Export format: json, mermaid"),
-    output: Optional[Path] = typer.Option(None, "--output", "-o", help="Output file (default: scp.json or scp.mmd)"),
-    stdout: bool = typer.Option(False, "--stdout", help="Output to stdout instead of file"),
-):
-    """Scan a local directory for SCP files and build the architecture graph."""
-    
-    console.print(f"[bold blue]Scanning[/] {path}")
-    
-    # Find SCP files
+
+# .graph (neo4j driver) and .scanner.github (httpx) are imported lazily in
+# the command bodies that need them, so cheap commands don't pay for them.
+
+
+def _safe_load(path: Path) -> tuple[SCPManifest | None, str, SCPParseError | None]:
+    """Parse a single SCP file, capturing parse errors instead of raising.
+
+    Module-level so it can be dispatched to worker processes.
+    """
     try:
-        scp_files = scan_directory(path)
-    except (FileNotFoundError, NotADirectoryError) as e:
-        console.print(f"[red]Error:[/] {e}")
-        raise typer.Exit(1)
-    
-    if not scp_files:
-        console.print("[yellow]No scp.yaml files found[/]")
-        raise typer.Exit(0)
-    
-    console.print(f"Found [green]{len(scp_files)}[/] SCP files\n")
-    
-    # Parse all files
-    manifests = []
-    errors = []
-    
-    for scp_file in scp_files:
-        try:
-            manifest = load_scp(scp_file)
-            manifests.append((manifest, str(scp_file)))
-            console.print(f"  ✓ [green]{manifest.system.name}[/] ({manifest.system.urn})")
-        except SCPParseError as e:
-            errors.append(e)
-            console.print(f"  ✗ [red]{scp_file}[/]: {e}")
-    
-    if errors:
-        console.print(f"\n[yellow]Warning:[/] {len(errors)} files failed to parse")
-    
+        return load_scp(path), str(path), None
+    except SCPParseError as e:
+        return None, str(path), e
+
+
+def _read_scp(path: Path) -> tuple[str, str | None, SCPParseError | None]:
+    """Read one SCP file's content, capturing I/O errors for the caller."""
+    try:
+        return str(path), path.read_text(encoding="utf-8"), None
+    except FileNotFoundError:
+        return str(path), None, SCPParseError(path, "File not found")
+    except OSError as e:
+        return str(path), None, SCPParseError(path, str(e))
+
+
+def _parse_content(entry: tuple[str, str]) -> tuple[SCPManifest | None, str, SCPParseError | None]:
+    """Parse already-read SCP content, capturing parse errors.
+
+    Module-level so it can be dispatched to worker processes.
+    """
+    source, content = entry
+    try:
+        return load_scp_from_content(content, source), source, None
+    except SCPParseError as e:
+        return None, source, e
+
+
+def _parse_scp_files(scp_files: list[Path]) -> list[tuple[SCPManifest | None, str, SCPParseError | None]]:
+    """Parse SCP files in a two-stage parallel pipeline.
+
+    Reads are I/O-bound, so a thread pool issues many in flight to
+    overlap disk latency; parsing is CPU-bound, so the raw content is
+    then fanned out across a process pool. Input order is preserved.
+    """
+    io_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=io_workers) as io_pool:
+        reads = list(io_pool.map(_read_scp, scp_files))
+
+    to_parse = [(source, content) for source, content, error in reads if error is None]
+    chunksize = max(1, len(to_parse) // ((os.cpu_count() or 1) * 4))
+    with ProcessPoolExecutor() as executor:
+        parsed = executor.map(_parse_content, to_parse, chunksize=chunksize)
+
+        # Merge read failures back in input order
+        results: list[tuple[SCPManifest | None, str, SCPParseError | None]] = []
+        for source, _, error in reads:
+            results.append((None, source, error) if error else next(parsed))
+    return results
+
+
+def _sync_and_export(manifests: list[tuple[SCPManifest, str]], args: argparse.Namespace) -> None:
+    """Post-parse pipeline shared by the scan commands.
+
+    Syncs manifests to Neo4j when connection options are set, then
+    writes the requested export format, if any.
+    """
     # Sync to Neo4j if configured
-    if neo4j_uri and neo4j_user and neo4j_password:
-        console.print(f"\n[bold blue]Syncing to Neo4j[/] {neo4j_uri}")
-        
+    if args.neo4j_uri and args.neo4j_user and args.neo4j_password:
+        from .graph import Neo4jGraph
+
+        print(f"\nSyncing to Neo4j {args.neo4j_uri}")
+
         try:
-            with Neo4jGraph(neo4j_uri, neo4j_user, neo4j_password) as graph:
-                graph.setup_constraints()
+            with Neo4jGraph(args.neo4j_uri, args.neo4j_user, args.neo4j_password) as graph:
+                graph.ensure_schema()
                 stats = graph.sync_manifests(manifests)
-                
-                console.print(Panel(
-                    f"Systems: {stats.systems_created} created, {stats.systems_updated} updated\n"
-                    f"Capabilities: {stats.capabilities_created}\n"
-                    f"Dependencies: {stats.dependencies_created}",
-                    title="Graph Stats",
-                    border_style="green",
-                ))
+
+                print("Graph Stats:")
+                print(f"  Systems: {stats.systems_created} created, {stats.systems_updated} updated")
+                print(f"  Capabilities: {stats.capabilities_created}")
+                print(f"  Dependencies: {stats.dependencies_created}")
         except Exception as e:
-            console.print(f"[red]Neo4j Error:[/] {e}")
-            raise typer.Exit(1)
-    
+            print(f"Neo4j Error: {e}")
+            raise SystemExit(1)
+
     # Export if requested
-    if export_format:
-        manifest_list = [m for m, _ in manifests]
-        
-        if export_format == "json":
-            data = export_json(manifest_list)
-            content = json.dumps(data, indent=2)
-        elif export_format == "mermaid":
-            content = export_mermaid(manifest_list)
-        elif export_format == "openc2":
-            data = export_openc2(manifest_list)
-            content = json.dumps(data, indent=2)
+    if args.export_format:
+        # Each export consumes the manifests once, so a lazy view over the
+        # (manifest, source) tuples avoids copying the list
+        manifest_view = (m for m, _ in manifests)
+
+        if args.export_format == "json":
+            content = export_json_bytes(manifest_view)
+        elif args.export_format == "mermaid":
+            content = export_mermaid(manifest_view)
+        elif args.export_format == "openc2":
+            content = encode_json(export_openc2(manifest_view))
         else:
-            console.print(f"[red]Unknown export format:[/] {export_format}. Use: json, mermaid, openc2")
-            raise typer.Exit(1)
-        
-        if stdout:
+            print(f"Unknown export format: {args.export_format}. Use: json, mermaid, openc2")
+            raise SystemExit(1)
+
+        if args.stdout:
             # Output to stdout
-            print(content)
+            print(content.decode("utf-8") if isinstance(content, bytes) else content)
         else:
             # Write to file
-            if output:
-                out_file = output
+            if args.output:
+                out_file = args.output
             else:
-                out_file = Path(f"scp.{'mmd' if export_format == 'mermaid' else 'json'}")
-            out_file.write_text(content)
-            console.print(f"\n[green]Exported to[/] {out_file}")
-
-
-@app.command("scan-github")
-def scan_github(
-    org: str = typer.Argument(..., help="GitHub organization to scan"),
-    token: Optional[str] = typer.Option(None, "--token", envvar="GITHUB_TOKEN", help="GitHub personal access token"),
-    neo4j_uri: Optional[str] = typer.Option(None, "--neo4j-uri", envvar="NEO4J_URI", help="Neo4j URI"),
-    neo4j_user: Optional[str] = typer.Option(None, "--neo4j-user", envvar="NEO4J_USER", help="Neo4j username"),
-    neo4j_password: Optional[str] = typer.Option(None, "--neo4j-password", envvar="NEO4J_PASSWORD", help="Neo4j password"),
-    export_format: Optional[str] = typer.Option(None, "--export", "-e", help="Export format: json, mermaid"),
-    output: Optional[Path] = typer.Option(None, "--output", "-o", help="Output file (default: scp.json or scp.mmd)"),
-    stdout: bool = typer.Option(False, "--stdout", help="Output to stdout instead of file"),
-):
+                out_file = Path(f"scp.{'mmd' if args.export_format == 'mermaid' else 'json'}")
+            if isinstance(content, bytes):
+                out_file.write_bytes(content)
+            else:
+                out_file.write_text(content)
+            print(f"\nExported to {out_file}")
+
+
+def scan(args: argparse.Namespace) -> None:
+    """Scan a local directory for SCP files and build the architecture graph."""
+
+    print(f"Scanning {args.path}")
+
+    # Find SCP files
+    try:
+        scp_files = scan_directory(args.path)
+    except (FileNotFoundError, NotADirectoryError) as e:
+        print(f"Error: {e}")
+        raise SystemExit(1)
+
+    if not scp_files:
+        print("No scp.yaml files found")
+        raise SystemExit(0)
+
+    print(f"Found {len(scp_files)} SCP files\n")
+
+    # Parse all files
+    manifests = []
+    errors = []
+
+    for manifest, source, error in _parse_scp_files(scp_files):
+        if error is None:
+            manifests.append((manifest, source))
+            print(f"  ✓ {manifest.system.name} ({manifest.system.urn})")
+        else:
+            errors.append(error)
+            print(f"  ✗ {source}: {error}")
+
+    if errors:
+        print(f"\nWarning: {len(errors)} files failed to parse")
+
+    _sync_and_export(manifests, args)
+
+
+def scan_github(args: argparse.Namespace) -> None:
     """Scan a GitHub organization for SCP files."""
-    
-    if not token:
-        console.print("[red]Error:[/] GitHub token required (--token or GITHUB_TOKEN env var)")
-        raise typer.Exit(1)
-    
-    console.print(f"[bold blue]Scanning GitHub org[/] {org}")
-    
+
+    if not args.token:
+        print("Error: GitHub token required (--token or GITHUB_TOKEN env var)")
+        raise SystemExit(1)
+
+    print(f"Scanning GitHub org {args.org}")
+
+    from .scanner.github import scan_github_org
+
     try:
-        scp_files = scan_github_org(org, token)
+        scp_files = scan_github_org(args.org, args.token)
     except Exception as e:
-        console.print(f"[red]GitHub API Error:[/] {e}")
-        raise typer.Exit(1)
-    
+        print(f"GitHub API Error: {e}")
+        raise SystemExit(1)
+
     if not scp_files:
-        console.print("[yellow]No scp.yaml files found[/]")
-        raise typer.Exit(0)
-    
-    console.print(f"Found [green]{len(scp_files)}[/] SCP files\n")
-    
+        print("No scp.yaml files found")
+        raise SystemExit(0)
+
+    print(f"Found {len(scp_files)} SCP files\n")
+
     for scp_file in scp_files:
-        console.print(f"  ✓ [green]{scp_file.manifest.system.name}[/] ({scp_file.repo})")
-    
+        print(f"  ✓ {scp_file.manifest.system.name} ({scp_file.repo})")
+
     manifests = [(f.manifest, f.repo) for f in scp_files]
-    
-    # Sync to Neo4j if configured
-    if neo4j_uri and neo4j_user and neo4j_password:
-        console.print(f"\n[bold blue]Syncing to Neo4j[/] {neo4j_uri}")
-        
-        try:
-            with Neo4jGraph(neo4j_uri, neo4j_user, neo4j_password) as graph:
-                graph.setup_constraints()
-                stats = graph.sync_manifests(manifests)
-                
-                console.print(Panel(
-                    f"Systems: {stats.systems_created} created, {stats.systems_updated} updated\n"
-                    f"Capabilities: {stats.capabilities_created}\n"
-                    f"Dependencies: {stats.dependencies_created}",
-                    title="Graph Stats",
-                    border_style="green",
-                ))
-        except Exception as e:
-            console.print(f"[red]Neo4j Error:[/] {e}")
-            raise typer.Exit(1)
-    
-    # Export if requested
-    if export_format:
-        manifest_list = [m for m, _ in manifests]
-        
-        if export_format == "json":
-            data = export_json(manifest_list)
-            content = json.dumps(data, indent=2)
-        elif export_format == "mermaid":
-            content = export_mermaid(manifest_list)
-        elif export_format == "openc2":
-            data = export_openc2(manifest_list)
-            content = json.dumps(data, indent=2)
-        else:
-            console.print(f"[red]Unknown export format:[/] {export_format}. Use: json, mermaid, openc2")
-            raise typer.Exit(1)
-        
-        if stdout:
-            # Output to stdout
-            print(content)
-        else:
-            # Write to file
-            if output:
-                out_file = output
-            else:
-                out_file = Path(f"scp.{'mmd' if export_format == 'mermaid' else 'json'}")
-            out_file.write_text(content)
-            console.print(f"\n[green]Exported to[/] {out_file}")
 
+    _sync_and_export(manifests, args)
 
-@app.command()
-def validate(
-    path: Path = typer.Argument(..., help="Path to scp.yaml file or directory"),
-):
+
+def validate(args: argparse.Namespace) -> None:
     """Validate SCP files without syncing to a graph."""
-    
-    if path.is_file():
-        files = [path]
+
+    if args.path.is_file():
+        files = [args.path]
     else:
-        files = scan_directory(path)
-    
+        files = scan_directory(args.path)
+
     if not files:
-        console.print("[yellow]No SCP files found[/]")
-        raise typer.Exit(0)
-    
+        print("No SCP files found")
+        raise SystemExit(0)
+
+    # Parse in parallel (not worth a pool for a single file), then
+    # keep the reporting loop serial so output order is stable
+    if len(files) == 1:
+        results = [_safe_load(files[0])]
+    else:
+        results = _parse_scp_files(files)
+
     errors = 0
-    
-    for scp_file in files:
-        try:
-            manifest = load_scp(scp_file)
-            console.print(f"✓ [green]{scp_file}[/]")
-            console.print(f"  System: {manifest.system.name} ({manifest.system.urn})")
-            
+
+    for manifest, source, error in results:
+        if error is None:
+            print(f"✓ {source}")
+            print(f"  System: {manifest.system.name} ({manifest.system.urn})")
+
             if manifest.depends:
-                console.print(f"  Dependencies: {len(manifest.depends)}")
+                print(f"  Dependencies: {len(manifest.depends)}")
             if manifest.provides:
-                console.print(f"  Capabilities: {len(manifest.provides)}")
-                
-        except SCPParseError as e:
+                print(f"  Capabilities: {len(manifest.provides)}")
+
+        else:
             errors += 1
-            console.print(f"✗ [red]{scp_file}[/]")
-            console.print(f"  Error: {e}")
-            for err in e.errors[:5]:  # Show first 5 errors
+            print(f"✗ {source}")
+            print(f"  Error: {error}")
+            for err in error.errors[:5]:  # Show first 5 errors
                 loc = ".".join(str(part) for part in err.get("loc", []))
-                console.print(f"    - {loc}: {err.get('msg', 'Unknown error')}")
-    
+                print(f"    - {loc}: {err.get('msg', 'Unknown error')}")
+
     if errors:
-        console.print(f"\n[red]{errors} file(s) failed validation[/]")
-        raise typer.Exit(1)
+        print(f"\n{errors} file(s) failed validation")
+        raise SystemExit(1)
     else:
-        console.print(f"\n[green]All {len(files)} file(s) valid[/]")
+        print(f"\nAll {len(files)} file(s) valid")
 
 
-@app.command()
-def transform(
-    input_file: Path = typer.Argument(..., help="JSON file from 'scp-cli scan' output"),
-    export_format: str = typer.Option(..., "--export", "-e", help="Export format: mermaid, openc2"),
-    output: Optional[Path] = typer.Option(None, "--output", "-o", help="Output file"),
-    stdout: bool = typer.Option(False, "--stdout", help="Output to stdout instead of file"),
-):
+def transform(args: argparse.Namespace) -> None:
     """Transform a JSON graph to other formats.
-    
+
     Use this when you have a previously exported JSON file and want to
     convert it to Mermaid diagrams or OpenC2 actuator profiles.
     """
-    if not input_file.exists():
-        console.print(f"[red]Error:[/] File not found: {input_file}")
-        raise typer.Exit(1)
-    
-    console.print(f"[bold blue]Loading[/] {input_file}")
-    
+    if not args.input_file.exists():
+        print(f"Error: File not found: {args.input_file}")
+        raise SystemExit(1)
+
+    print(f"Loading {args.input_file}")
+
     try:
-        data = json.loads(input_file.read_text())
+        data = json.loads(args.input_file.read_text())
     except json.JSONDecodeError as e:
-        console.print(f"[red]JSON Error:[/] {e}")
-        raise typer.Exit(1)
-    
+        print(f"JSON Error: {e}")
+        raise SystemExit(1)
+
     # Import manifests from JSON
     manifests = import_json(data)
-    console.print(f"Loaded [green]{len(manifests)}[/] systems")
-    
+    print(f"Loaded {len(manifests)} systems")
+
     # Transform to requested format
-    if export_format == "mermaid":
+    if args.export_format == "mermaid":
         content = export_mermaid(manifests)
         default_ext = "mmd"
-    elif export_format == "openc2":
+    elif args.export_format == "openc2":
         result = export_openc2(manifests)
-        content = json.dumps(result, indent=2)
+        content = encode_json(result)
         default_ext = "json"
-        console.print(f"Found [green]{result['count']}[/] security actuators")
-    elif export_format == "json":
+        print(f"Found {result['count']} security actuators")
+    elif args.export_format == "json":
         # Re-export as JSON (useful for filtering)
-        result = export_json(manifests)
-        content = json.dumps(result, indent=2)
+        content = export_json_bytes(manifests)
         default_ext = "json"
     else:
-        console.print(f"[red]Unknown export format:[/] {export_format}. Use: mermaid, openc2, json")
-        raise typer.Exit(1)
-    
-    if stdout:
-        print(content)
+        print(f"Unknown export format: {args.export_format}. Use: mermaid, openc2, json")
+        raise SystemExit(1)
+
+    if args.stdout:
+        print(content.decode("utf-8") if isinstance(content, bytes) else content)
     else:
-        if output:
-            out_file = output
+        if args.output:
+            out_file = args.output
         else:
             out_file = Path(f"scp-transformed.{default_ext}")
-        out_file.write_text(content)
-        console.print(f"[green]Exported to[/] {out_file}")
+        if isinstance(content, bytes):
+            out_file.write_bytes(content)
+        else:
+            out_file.write_text(content)
+        print(f"Exported to {out_file}")
 
 
-@app.command()
-def version():
+def version(args: argparse.Namespace) -> None:
     """Show version information."""
-    console.print(f"scp-constructor v{__version__}")
+    print(f"scp-constructor v{__version__}")
+
+
+def _add_neo4j_args(parser: argparse.ArgumentParser) -> None:
+    """Add the Neo4j connection options shared by the scan commands."""
+    parser.add_argument(
+        "--neo4j-uri", default=os.environ.get("NEO4J_URI"), help="Neo4j URI"
+    )
+    parser.add_argument(
+        "--neo4j-user", default=os.environ.get("NEO4J_USER"), help="Neo4j username"
+    )
+    parser.add_argument(
+        "--neo4j-password", default=os.environ.get("NEO4J_PASSWORD"), help="Neo4j password"
+    )
+
+
+def _add_export_args(parser: argparse.ArgumentParser) -> None:
+    """Add the export options shared by the scan commands."""
+    parser.add_argument(
+        "--export", "-e", dest="export_format", help="Export format: json, mermaid"
+    )
+    parser.add_argument(
+        "--output", "-o", type=Path, help="Output file (default: scp.json or scp.mmd)"
+    )
+    parser.add_argument(
+        "--stdout", action="store_true", help="Output to stdout instead of file"
+    )
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the top-level argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="scp",
+        description="SCP Constructor - Build architecture graphs from scp.yaml files",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    scan_parser = subparsers.add_parser(
+        "scan", help="Scan a local directory for SCP files"
+    )
+    scan_parser.add_argument(
+        "path", type=Path, help="Directory to scan for scp.yaml files"
+    )
+    _add_neo4j_args(scan_parser)
+    _add_export_args(scan_parser)
+    scan_parser.set_defaults(func=scan)
+
+    github_parser = subparsers.add_parser(
+        "scan-github", help="Scan a GitHub organization for SCP files"
+    )
+    github_parser.add_argument("org", help="GitHub organization to scan")
+    github_parser.add_argument(
+        "--token",
+        default=os.environ.get("GITHUB_TOKEN"),
+        help="GitHub personal access token",
+    )
+    _add_neo4j_args(github_parser)
+    _add_export_args(github_parser)
+    github_parser.set_defaults(func=scan_github)
+
+    validate_parser = subparsers.add_parser(
+        "validate", help="Validate SCP files without syncing to a graph"
+    )
+    validate_parser.add_argument(
+        "path", type=Path, help="Path to scp.yaml file or directory"
+    )
+    validate_parser.set_defaults(func=validate)
+
+    transform_parser = subparsers.add_parser(
+        "transform", help="Transform a JSON graph to other formats"
+    )
+    transform_parser.add_argument(
+        "input_file", type=Path, help="JSON file from 'scp-cli scan' output"
+    )
+    transform_parser.add_argument(
+        "--export", "-e", dest="export_format", required=True,
+        help="Export format: mermaid, openc2",
+    )
+    transform_parser.add_argument(
+        "--output", "-o", type=Path, help="Output file"
+    )
+    transform_parser.add_argument(
+        "--stdout", action="store_true", help="Output to stdout instead of file"
+    )
+    transform_parser.set_defaults(func=transform)
+
+    version_parser = subparsers.add_parser("version", help="Show version information")
+    version_parser.set_defaults(func=version)
+
+    return parser
+
+
+def app(argv: list[str] | None = None) -> None:
+    """CLI entry point."""
+    args = _build_parser().parse_args(argv)
+    args.func(args)
 
 
 if __name__ == "__main__":
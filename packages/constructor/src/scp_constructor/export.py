@@ -1,107 +1,330 @@
 """Export functions for architecture graph data."""
 
+import functools
+import io
+import json
+import operator
+import sys
+from collections.abc import Iterable
 from typing import Any
 
+try:
+    import msgspec
+except ImportError:  # optional accelerator
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:  # optional accelerator
+    orjson = None
+
 from .models import SCPManifest
 
 
-def export_json(manifests: list[SCPManifest]) -> dict[str, Any]:
+def encode_json(data: Any) -> bytes:
+    """Serialize graph data to indented JSON bytes.
+
+    Uses the C-implemented orjson encoder when installed (the 'perf'
+    extra), falling back to the stdlib encoder.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+if msgspec is not None:
+    # Typed node/edge structs mirroring the dicts built by export_json.
+    # Slotted and constructed in C, they keep both the graph build loop
+    # and the JSON encode out of the interpreter for the CLI fast path.
+
+    class _SystemNode(msgspec.Struct):
+        id: str
+        type: str
+        name: str
+        tier: int | None = None
+        domain: str | None = None
+        team: str | None = None
+
+    class _StubNode(msgspec.Struct):
+        id: str
+        type: str
+        name: str
+        stub: bool = True
+
+    class _SecurityInfo(msgspec.Struct):
+        actuator_profile: str | None
+        actions: list[str]
+        targets: list[str]
+
+    class _CapabilityNode(msgspec.Struct, omit_defaults=True):
+        id: str
+        type: str
+        name: str
+        capability_type: str
+        x_security: _SecurityInfo | None = None
+
+    class _DependsEdge(msgspec.Struct):
+        from_: str = msgspec.field(name="from")
+        to: str = ""
+        type: str = "DEPENDS_ON"
+        capability: str | None = None
+        criticality: str = "required"
+        failure_mode: str | None = None
+
+    class _ProvidesEdge(msgspec.Struct):
+        from_: str = msgspec.field(name="from")
+        to: str = ""
+        type: str = "PROVIDES"
+
+    class _Meta(msgspec.Struct):
+        systems_count: int
+        capabilities_count: int
+        dependencies_count: int
+
+    class _Graph(msgspec.Struct):
+        nodes: list
+        edges: list
+        meta: _Meta
+
+
+def export_json(manifests: Iterable[SCPManifest]) -> dict[str, Any]:
     """Export manifests to a JSON-serializable graph structure.
-    
+
     Args:
-        manifests: List of SCP manifests
-        
+        manifests: Iterable of SCP manifests (consumed in one pass)
+
     Returns:
         Dictionary with nodes and edges lists
     """
-    nodes: list[dict] = []
-    edges: list[dict] = []
+    # Pre-size the edge list when the input length is known, index-assigning
+    # up to the estimate to avoid append-time reallocations; lazy iterables
+    # fall back to plain appends
+    try:
+        expected_edges = 2 * len(manifests)  # type: ignore[arg-type]  # ~1 dep + 1 cap per manifest
+    except TypeError:
+        expected_edges = 0
+    edges: list[dict] = [None] * expected_edges  # type: ignore[list-item]
+    edge_idx = 0
     system_nodes: dict[str, dict] = {}  # Track by URN for stub replacement
-    
+    capability_nodes: dict[str, dict] = {}  # Track by id to dedup repeat manifests
+    dependencies_count = 0
+
+    # C-level multi-attribute fetches for the per-dep/per-cap loops
+    dep_get = operator.attrgetter("system", "capability", "criticality", "failure_mode")
+    cap_get = operator.attrgetter("capability", "type", "x_security")
+
     for manifest in manifests:
-        urn = manifest.system.urn
-        
+        system = manifest.system
+        # Re-intern here: manifests parsed in worker processes lose string
+        # identity when unpickled, and URNs key every dict probe below
+        urn = sys.intern(system.urn)
+        classification = system.classification
+        ownership = manifest.ownership
+
         # Add or update system node (replaces stub if exists)
         system_nodes[urn] = {
             "id": urn,
             "type": "System",
-            "name": manifest.system.name,
-            "tier": manifest.system.classification.tier if manifest.system.classification else None,
-            "domain": manifest.system.classification.domain if manifest.system.classification else None,
-            "team": manifest.ownership.team if manifest.ownership else None,
+            "name": system.name,
+            "tier": classification.tier if classification else None,
+            "domain": classification.domain if classification else None,
+            "team": ownership.team if ownership else None,
         }
-        
+
         # Add dependency edges (create stub only if not already known)
         if manifest.depends:
             for dep in manifest.depends:
+                dep_system, dep_capability, dep_criticality, dep_failure_mode = dep_get(dep)
+                dep_system = sys.intern(dep_system)
+
                 # Create stub node for dependency target if not seen
-                if dep.system not in system_nodes:
-                    system_nodes[dep.system] = {
-                        "id": dep.system,
+                if dep_system not in system_nodes:
+                    system_nodes[dep_system] = {
+                        "id": dep_system,
                         "type": "System",
-                        "name": dep.system.split(":")[-1],  # Extract name from URN
+                        "name": dep_system.split(":")[-1],  # Extract name from URN
                         "stub": True,
                     }
-                
-                edges.append({
+
+                edge = {
                     "from": urn,
-                    "to": dep.system,
+                    "to": dep_system,
                     "type": "DEPENDS_ON",
-                    "capability": dep.capability,
-                    "criticality": dep.criticality,
-                    "failure_mode": dep.failure_mode,
-                })
+                    "capability": dep_capability,
+                    "criticality": dep_criticality,
+                    "failure_mode": dep_failure_mode,
+                }
+                if edge_idx < expected_edges:
+                    edges[edge_idx] = edge
+                else:
+                    edges.append(edge)
+                edge_idx += 1
+                dependencies_count += 1
         
-        # Add capability nodes and PROVIDES edges
+        # Add capability nodes and PROVIDES edges (skip already-seen ids)
         if manifest.provides:
             for cap in manifest.provides:
-                cap_id = f"{urn}:{cap.capability}"
+                cap_name, cap_type, x_security = cap_get(cap)
+                cap_id = f"{urn}:{cap_name}"
+                if cap_id in capability_nodes:
+                    continue
                 cap_node: dict[str, Any] = {
                     "id": cap_id,
                     "type": "Capability",
-                    "name": cap.capability,
-                    "capability_type": cap.type,
+                    "name": cap_name,
+                    "capability_type": cap_type,
                 }
                 # Include security extension if present
-                if cap.x_security:
+                if x_security:
                     cap_node["x_security"] = {
-                        "actuator_profile": cap.x_security.actuator_profile,
-                        "actions": cap.x_security.actions,
-                        "targets": cap.x_security.targets,
+                        "actuator_profile": x_security.actuator_profile,
+                        "actions": x_security.actions,
+                        "targets": x_security.targets,
                     }
-                nodes.append(cap_node)
-                edges.append({
+                capability_nodes[cap_id] = cap_node
+                edge = {
                     "from": urn,
                     "to": cap_id,
                     "type": "PROVIDES",
-                })
-    
-    # Combine system nodes (from dict) with capability nodes (from list)
-    all_nodes = list(system_nodes.values()) + nodes
-    
+                }
+                if edge_idx < expected_edges:
+                    edges[edge_idx] = edge
+                else:
+                    edges.append(edge)
+                edge_idx += 1
+
+    # Drop unused pre-sized slots
+    del edges[edge_idx:]
+
+    # Combine system nodes with capability nodes
+    all_nodes = list(system_nodes.values()) + list(capability_nodes.values())
+
     return {
         "nodes": all_nodes,
         "edges": edges,
         "meta": {
             "systems_count": len(system_nodes),
-            "capabilities_count": len(nodes),
-            "dependencies_count": len([e for e in edges if e["type"] == "DEPENDS_ON"]),
+            "capabilities_count": len(capability_nodes),
+            "dependencies_count": dependencies_count,
         },
     }
 
 
-def export_mermaid(manifests: list[SCPManifest], direction: str = "LR") -> str:
+def export_json_bytes(manifests: Iterable[SCPManifest]) -> bytes:
+    """Export manifests straight to indented JSON bytes.
+
+    Fast path for the CLI: with msgspec installed the graph is built
+    from slotted Structs and encoded entirely in C, producing the same
+    JSON as export_json (must stay in sync with it). Without msgspec it
+    falls back to export_json plus encode_json.
+    """
+    if msgspec is None:
+        return encode_json(export_json(manifests))
+
+    edges: list = []
+    system_nodes: dict[str, Any] = {}
+    capability_nodes: dict[str, Any] = {}
+    dependencies_count = 0
+
+    dep_get = operator.attrgetter("system", "capability", "criticality", "failure_mode")
+    cap_get = operator.attrgetter("capability", "type", "x_security")
+
+    for manifest in manifests:
+        system = manifest.system
+        urn = sys.intern(system.urn)
+        classification = system.classification
+        ownership = manifest.ownership
+
+        system_nodes[urn] = _SystemNode(
+            id=urn,
+            type="System",
+            name=system.name,
+            tier=classification.tier if classification else None,
+            domain=classification.domain if classification else None,
+            team=ownership.team if ownership else None,
+        )
+
+        if manifest.depends:
+            for dep in manifest.depends:
+                dep_system, dep_capability, dep_criticality, dep_failure_mode = dep_get(dep)
+                dep_system = sys.intern(dep_system)
+
+                if dep_system not in system_nodes:
+                    system_nodes[dep_system] = _StubNode(
+                        id=dep_system,
+                        type="System",
+                        name=dep_system.split(":")[-1],
+                    )
+
+                edges.append(_DependsEdge(
+                    from_=urn,
+                    to=dep_system,
+                    capability=dep_capability,
+                    criticality=dep_criticality,
+                    failure_mode=dep_failure_mode,
+                ))
+                dependencies_count += 1
+
+        if manifest.provides:
+            for cap in manifest.provides:
+                cap_name, cap_type, x_security = cap_get(cap)
+                cap_id = f"{urn}:{cap_name}"
+                if cap_id in capability_nodes:
+                    continue
+                cap_node = _CapabilityNode(
+                    id=cap_id,
+                    type="Capability",
+                    name=cap_name,
+                    capability_type=cap_type,
+                )
+                if x_security:
+                    cap_node.x_security = _SecurityInfo(
+                        actuator_profile=x_security.actuator_profile,
+                        actions=x_security.actions,
+                        targets=x_security.targets,
+                    )
+                capability_nodes[cap_id] = cap_node
+                edges.append(_ProvidesEdge(from_=urn, to=cap_id))
+
+    graph = _Graph(
+        nodes=list(system_nodes.values()) + list(capability_nodes.values()),
+        edges=edges,
+        meta=_Meta(
+            systems_count=len(system_nodes),
+            capabilities_count=len(capability_nodes),
+            dependencies_count=dependencies_count,
+        ),
+    )
+    return msgspec.json.format(msgspec.json.encode(graph), indent=2)
+
+
+# Node/edge line templates for export_mermaid, keyed by tier / label presence.
+# Tier 1 (critical) systems get a double border.
+_MERMAID_NODE_TEMPLATES = {
+    1: '    {id}[["🔴 {name}"]]',
+    2: '    {id}["🟡 {name}"]',
+    None: '    {id}["{name}"]',
+}
+_MERMAID_EDGE_LABELED = "    {from_id} -->|{capability}| {to_id}"
+_MERMAID_EDGE_PLAIN = "    {from_id} --> {to_id}"
+
+
+def export_mermaid(manifests: Iterable[SCPManifest], direction: str = "LR") -> str:
     """Export manifests to a Mermaid flowchart diagram.
-    
+
     Args:
-        manifests: List of SCP manifests  
+        manifests: Iterable of SCP manifests (consumed in one pass)
         direction: Graph direction (TB, BT, LR, RL)
-        
+
     Returns:
         Mermaid diagram string
     """
-    lines = [f"flowchart {direction}"]
-    
+    # Stream lines into a single StringIO buffer: one C-level write per
+    # line instead of a list append plus a final join traversal
+    buf = io.StringIO()
+    w = buf.write
+    w(f"flowchart {direction}")
+
     # Track systems and their properties
     systems: dict[str, dict] = {}
     dependencies: list[tuple[str, str, str | None]] = []
@@ -131,45 +354,38 @@ def export_mermaid(manifests: list[SCPManifest], direction: str = "LR") -> str:
                     }
     
     # Output system nodes with styling
-    lines.append("")
-    lines.append("    %% Systems")
-    for urn, info in systems.items():
-        tier = info["tier"]
-        name = info["name"]
-        node_id = info["id"]
-        
-        if tier == 1:
-            # Critical systems - double border
-            lines.append(f'    {node_id}[["🔴 {name}"]]')
-        elif tier == 2:
-            lines.append(f'    {node_id}["🟡 {name}"]')
-        else:
-            lines.append(f'    {node_id}["{name}"]')
-    
+    w("\n\n    %% Systems")
+    for info in systems.values():
+        w("\n")
+        w(
+            _MERMAID_NODE_TEMPLATES.get(info["tier"], _MERMAID_NODE_TEMPLATES[None])
+            .format(id=info["id"], name=info["name"])
+        )
+
     # Output dependency edges
-    lines.append("")
-    lines.append("    %% Dependencies")
+    w("\n\n    %% Dependencies")
     for from_urn, to_urn, capability in dependencies:
-        from_id = systems[from_urn]["id"]
-        to_id = systems[to_urn]["id"]
-        
-        if capability:
-            lines.append(f"    {from_id} -->|{capability}| {to_id}")
-        else:
-            lines.append(f"    {from_id} --> {to_id}")
-    
+        w("\n")
+        w(
+            (_MERMAID_EDGE_LABELED if capability else _MERMAID_EDGE_PLAIN).format(
+                from_id=systems[from_urn]["id"],
+                to_id=systems[to_urn]["id"],
+                capability=capability,
+            )
+        )
+
     # Add styling
-    lines.append("")
-    lines.append("    %% Styling")
-    
+    w("\n\n    %% Styling")
+
     tier1_ids = [info["id"] for info in systems.values() if info["tier"] == 1]
     if tier1_ids:
-        lines.append("    classDef critical fill:#ff6b6b,stroke:#333,stroke-width:2px")
-        lines.append(f"    class {','.join(tier1_ids)} critical")
-    
-    return "\n".join(lines)
+        w("\n    classDef critical fill:#ff6b6b,stroke:#333,stroke-width:2px")
+        w(f"\n    class {','.join(tier1_ids)} critical")
 
+    return buf.getvalue()
 
+
+@functools.lru_cache(maxsize=4096)
 def _urn_to_id(urn: str) -> str:
     """Convert a URN to a valid Mermaid node ID."""
     # Extract the service name and sanitize
@@ -179,14 +395,14 @@ def _urn_to_id(urn: str) -> str:
     return name.replace("-", "_")
 
 
-def export_openc2(manifests: list[SCPManifest]) -> dict[str, Any]:
+def export_openc2(manifests: Iterable[SCPManifest]) -> dict[str, Any]:
     """Export OpenC2 actuator profile for SOAR discovery.
-    
+
     Extracts security capabilities from manifests and formats them
     as an OpenC2-compatible actuator inventory.
-    
+
     Args:
-        manifests: List of SCP manifests
+        manifests: Iterable of SCP manifests (consumed in one pass)
         
     Returns:
         Dictionary with actuators list for SOAR consumption
@@ -1,13 +1,19 @@
 """Neo4j graph builder for SCP architecture data."""
 
+import hashlib
+import os
 from dataclasses import dataclass
+from pathlib import Path
 
 from neo4j import GraphDatabase
 
 from .models import SCPManifest
 
+# Rows per UNWIND batch when syncing manifests in bulk
+BATCH_SIZE = 1000
 
-@dataclass
+
+@dataclass(slots=True)
 class GraphStats:
     """Statistics from a graph sync operation."""
     
@@ -20,6 +26,11 @@ class GraphStats:
     owns_edges: int = 0
 
 
+def _chunked(rows: list[dict], size: int) -> list[list[dict]]:
+    """Split rows into batches of at most `size`."""
+    return [rows[i:i + size] for i in range(0, len(rows), size)]
+
+
 class Neo4jGraph:
     """Neo4j graph builder for SCP architecture data.
     
@@ -40,6 +51,7 @@ class Neo4jGraph:
             database: Database name (default: neo4j)
         """
         self.driver = GraphDatabase.driver(uri, auth=(user, password))
+        self.uri = uri
         self.database = database
     
     def close(self):
@@ -64,7 +76,31 @@ class Neo4jGraph:
         with self.driver.session(database=self.database) as session:
             for query in queries:
                 session.run(query)
-    
+
+    def ensure_schema(self) -> None:
+        """Run setup_constraints once per database, then skip it.
+
+        All schema statements use IF NOT EXISTS so re-running is safe but
+        still costs a round-trip per statement. A marker file keyed by
+        URI and database name in the user cache dir short-circuits repeat
+        invocations; delete the marker (or the cache dir) to force setup.
+        """
+        key = hashlib.sha1(f"{self.uri}:{self.database}".encode()).hexdigest()
+        cache_dir = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "scp-constructor"
+        marker = cache_dir / f"schema-{key}"
+
+        if marker.exists():
+            return
+
+        self.setup_constraints()
+
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            marker.touch()
+        except OSError:
+            # Cache dir not writable; schema is set up, just not memoized
+            pass
+
     def sync_manifest(self, manifest: SCPManifest, source: str | None = None) -> GraphStats:
         """Sync an SCP manifest to the graph database.
         
@@ -208,27 +244,156 @@ class Neo4jGraph:
         return stats
     
     def sync_manifests(self, manifests: list[tuple[SCPManifest, str | None]]) -> GraphStats:
-        """Sync multiple manifests to the graph.
-        
+        """Sync multiple manifests to the graph in batched transactions.
+
+        Instead of one transaction per manifest, all manifests are
+        flattened into row lists and written with UNWIND + MERGE in
+        batches of BATCH_SIZE, cutting the commit/round-trip overhead
+        to a handful of writes regardless of manifest count.
+
         Args:
             manifests: List of (manifest, source) tuples
-            
+
         Returns:
             Combined statistics
         """
-        total_stats = GraphStats()
-        
+        stats = GraphStats()
+
+        # Flatten manifests into per-entity row lists
+        system_rows: list[dict] = []
+        team_rows: list[dict] = []
+        capability_rows: list[dict] = []
+        dependency_rows: list[dict] = []
+
         for manifest, source in manifests:
-            stats = self.sync_manifest(manifest, source)
-            total_stats.systems_created += stats.systems_created
-            total_stats.systems_updated += stats.systems_updated
-            total_stats.capabilities_created += stats.capabilities_created
-            total_stats.teams_created += stats.teams_created
-            total_stats.dependencies_created += stats.dependencies_created
-            total_stats.provides_edges += stats.provides_edges
-            total_stats.owns_edges += stats.owns_edges
-        
-        return total_stats
+            system_rows.append({
+                "urn": manifest.system.urn,
+                "name": manifest.system.name,
+                "description": manifest.system.description,
+                "version": manifest.system.version,
+                "tier": manifest.system.classification.tier if manifest.system.classification else None,
+                "domain": manifest.system.classification.domain if manifest.system.classification else None,
+                "otel_service_name": manifest.otel_service_name,
+                "source": source,
+            })
+
+            if manifest.ownership:
+                team_rows.append({
+                    "team": manifest.ownership.team,
+                    "system_urn": manifest.system.urn,
+                })
+
+            if manifest.provides:
+                for cap in manifest.provides:
+                    capability_rows.append({
+                        "cap_id": f"{manifest.system.urn}:{cap.capability}",
+                        "name": cap.capability,
+                        "type": cap.type,
+                        "availability": cap.sla.availability if cap.sla else None,
+                        "latency_p99": cap.sla.latency_p99_ms if cap.sla else None,
+                        "system_urn": manifest.system.urn,
+                    })
+
+            if manifest.depends:
+                for dep in manifest.depends:
+                    dependency_rows.append({
+                        "from_urn": manifest.system.urn,
+                        "to_urn": dep.system,
+                        "capability": dep.capability,
+                        "type": dep.type,
+                        "criticality": dep.criticality,
+                        "failure_mode": dep.failure_mode,
+                        "timeout_ms": dep.timeout_ms,
+                    })
+
+        with self.driver.session(database=self.database) as session:
+            for chunk in _chunked(system_rows, BATCH_SIZE):
+                record = session.execute_write(lambda tx, rows=chunk: tx.run("""
+                    UNWIND $rows AS row
+                    MERGE (s:System {urn: row.urn})
+                    ON CREATE SET
+                        s.name = row.name,
+                        s.description = row.description,
+                        s.version = row.version,
+                        s.tier = row.tier,
+                        s.domain = row.domain,
+                        s.otel_service_name = row.otel_service_name,
+                        s.source = row.source,
+                        s.created_at = datetime(),
+                        s.updated_at = datetime()
+                    ON MATCH SET
+                        s.name = row.name,
+                        s.description = row.description,
+                        s.version = row.version,
+                        s.tier = row.tier,
+                        s.domain = row.domain,
+                        s.otel_service_name = row.otel_service_name,
+                        s.source = row.source,
+                        s.updated_at = datetime()
+                    RETURN sum(CASE WHEN s.created_at = s.updated_at THEN 1 ELSE 0 END) AS created,
+                           count(s) AS total
+                """, {"rows": rows}).single())
+                stats.systems_created += record["created"]
+                stats.systems_updated += record["total"] - record["created"]
+
+            for chunk in _chunked(team_rows, BATCH_SIZE):
+                session.execute_write(lambda tx, rows=chunk: tx.run("""
+                    UNWIND $rows AS row
+                    MERGE (t:Team {id: row.team})
+                    ON CREATE SET t.name = row.team
+                    WITH t, row
+                    MATCH (s:System {urn: row.system_urn})
+                    MERGE (t)-[r:OWNS]->(s)
+                    ON CREATE SET r.created_at = datetime()
+                """, {"rows": rows}).consume())
+                stats.teams_created += len(chunk)  # May be existing, but we count attempts
+                stats.owns_edges += len(chunk)
+
+            for chunk in _chunked(capability_rows, BATCH_SIZE):
+                session.execute_write(lambda tx, rows=chunk: tx.run("""
+                    UNWIND $rows AS row
+                    MERGE (c:Capability {id: row.cap_id})
+                    ON CREATE SET
+                        c.name = row.name,
+                        c.type = row.type,
+                        c.availability = row.availability,
+                        c.latency_p99_ms = row.latency_p99
+                    WITH c, row
+                    MATCH (s:System {urn: row.system_urn})
+                    MERGE (s)-[r:PROVIDES]->(c)
+                    ON CREATE SET
+                        r.sla_availability = row.availability,
+                        r.sla_latency_p99_ms = row.latency_p99
+                """, {"rows": rows}).consume())
+                stats.capabilities_created += len(chunk)
+                stats.provides_edges += len(chunk)
+
+            for chunk in _chunked(dependency_rows, BATCH_SIZE):
+                session.execute_write(lambda tx, rows=chunk: tx.run("""
+                    UNWIND $rows AS row
+                    MERGE (target:System {urn: row.to_urn})
+                    ON CREATE SET target.name = row.to_urn
+                    WITH target, row
+                    MATCH (from:System {urn: row.from_urn})
+                    MERGE (from)-[r:DEPENDS_ON {capability: row.capability}]->(target)
+                    ON CREATE SET
+                        r.type = row.type,
+                        r.criticality = row.criticality,
+                        r.failure_mode = row.failure_mode,
+                        r.timeout_ms = row.timeout_ms,
+                        r.declared = true,
+                        r.created_at = datetime()
+                    ON MATCH SET
+                        r.type = row.type,
+                        r.criticality = row.criticality,
+                        r.failure_mode = row.failure_mode,
+                        r.timeout_ms = row.timeout_ms,
+                        r.declared = true,
+                        r.updated_at = datetime()
+                """, {"rows": rows}).consume())
+                stats.dependencies_created += len(chunk)
+
+        return stats
     
     def get_all_systems(self) -> list[dict]:
         """Get all systems from the graph."""
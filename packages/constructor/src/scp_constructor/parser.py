@@ -1,5 +1,6 @@
 """YAML parser for SCP manifest files."""
 
+import sys
 from pathlib import Path
 
 import yaml
@@ -7,15 +8,37 @@ from pydantic import ValidationError
 
 from .models import SCPManifest
 
+# Prefer the libyaml-backed loader when PyYAML was built against it
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class SCPParseError(Exception):
     """Raised when an SCP file cannot be parsed or validated."""
 
     def __init__(self, path: Path, message: str, errors: list[dict] | None = None):
         self.path = path
+        self.message = message
         self.errors = errors or []
         super().__init__(f"{path}: {message}")
 
+    def __reduce__(self):
+        # Preserve the original arguments so instances survive pickling
+        # (e.g. when returned from worker processes)
+        return (type(self), (self.path, self.message, self.errors))
+
+
+def _intern_urns(manifest: SCPManifest) -> SCPManifest:
+    """Intern the manifest's URN strings.
+
+    URNs are the keys of every dedup dict and graph index downstream;
+    interning lets those probes short-circuit on pointer identity.
+    """
+    manifest.system.urn = sys.intern(manifest.system.urn)
+    if manifest.depends:
+        for dep in manifest.depends:
+            dep.system = sys.intern(dep.system)
+    return manifest
+
 
 def load_scp(path: Path) -> SCPManifest:
     """Load and validate an SCP manifest from a YAML file.
@@ -31,7 +54,7 @@ def load_scp(path: Path) -> SCPManifest:
     """
     try:
         with open(path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_Loader)
     except FileNotFoundError:
         raise SCPParseError(path, "File not found")
     except yaml.YAMLError as e:
@@ -41,7 +64,7 @@ def load_scp(path: Path) -> SCPManifest:
         raise SCPParseError(path, "Empty file")
 
     try:
-        return SCPManifest.model_validate(data)
+        return _intern_urns(SCPManifest.model_validate(data))
     except ValidationError as e:
         raise SCPParseError(
             path,
@@ -61,7 +84,7 @@ def load_scp_from_content(content: str, source: str = "<string>") -> SCPManifest
         Validated SCPManifest object
     """
     try:
-        data = yaml.safe_load(content)
+        data = yaml.load(content, Loader=_Loader)
     except yaml.YAMLError as e:
         raise SCPParseError(Path(source), f"Invalid YAML: {e}")
 
@@ -69,7 +92,7 @@ def load_scp_from_content(content: str, source: str = "<string>") -> SCPManifest
         raise SCPParseError(Path(source), "Empty content")
 
     try:
-        return SCPManifest.model_validate(data)
+        return _intern_urns(SCPManifest.model_validate(data))
     except ValidationError as e:
         raise SCPParseError(
             Path(source),
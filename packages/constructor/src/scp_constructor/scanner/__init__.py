@@ -1,6 +1,15 @@
 """Scanner modules for locating SCP files."""
 
 from .local import scan_directory
-from .github import scan_github_org
 
 __all__ = ["scan_directory", "scan_github_org"]
+
+
+def __getattr__(name):
+    # Import .github lazily so the httpx dependency isn't paid for
+    # local-only commands
+    if name == "scan_github_org":
+        from .github import scan_github_org
+
+        return scan_github_org
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
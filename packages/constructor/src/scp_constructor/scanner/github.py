@@ -9,7 +9,7 @@ from ..models import SCPManifest
 from ..parser import load_scp_from_content, SCPParseError
 
 
-@dataclass
+@dataclass(slots=True)
 class SCPFile:
     """Represents an SCP file found in a GitHub repository."""
     
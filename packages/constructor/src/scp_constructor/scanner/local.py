@@ -1,29 +1,69 @@
 """Local filesystem scanner for SCP files."""
 
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
 def scan_directory(root: Path, filename: str = "scp.yaml") -> list[Path]:
     """Recursively scan a directory for SCP manifest files.
-    
+
+    Directories are walked concurrently with os.scandir so that getdents
+    latency overlaps across subtrees instead of serializing one stat per
+    entry. DirEntry type checks reuse the cached stat from scandir, so no
+    extra syscalls are issued per entry.
+
     Args:
         root: Directory to scan
         filename: Name of manifest files to find (default: scp.yaml)
-        
+
     Returns:
         List of paths to discovered SCP files
     """
     root = Path(root)
-    
+
     if not root.exists():
         raise FileNotFoundError(f"Directory not found: {root}")
-    
+
     if not root.is_dir():
         raise NotADirectoryError(f"Not a directory: {root}")
-    
-    # Find all matching files recursively
-    scp_files = list(root.rglob(filename))
-    
+
+    scp_files: list[Path] = []
+    matches_lock = threading.Lock()
+    pending: queue.Queue[Path | None] = queue.Queue()
+    pending.put(root)
+
+    def _walk():
+        while True:
+            directory = pending.get()
+            if directory is None:
+                pending.task_done()
+                return
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.put(Path(entry.path))
+                        elif entry.name == filename:
+                            with matches_lock:
+                                scp_files.append(Path(entry.path))
+            except OSError:
+                # Unreadable directory; skip it like rglob would
+                pass
+            finally:
+                pending.task_done()
+
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for _ in range(max_workers):
+            pool.submit(_walk)
+        # Wait for the walk to drain, then release the workers
+        pending.join()
+        for _ in range(max_workers):
+            pending.put(None)
+
     # Sort for consistent ordering
     return sorted(scp_files)
 
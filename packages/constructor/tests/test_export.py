@@ -1,7 +1,14 @@
 """Tests for the export module."""
 
+import json
+
 import pytest
 
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
 from scp_constructor.models import (
     SCPManifest,
     System,
@@ -11,7 +18,13 @@ from scp_constructor.models import (
     Ownership,
     SecurityExtension,
 )
-from scp_constructor.export import export_json, export_mermaid, export_openc2, import_json
+from scp_constructor.export import (
+    export_json,
+    export_json_bytes,
+    export_mermaid,
+    export_openc2,
+    import_json,
+)
 
 
 @pytest.fixture
@@ -128,6 +141,18 @@ class TestExportJson:
         assert result["meta"]["capabilities_count"] == 2
         assert result["meta"]["dependencies_count"] == 1
 
+    def test_export_dedups_repeated_manifests(self, sample_manifests):
+        """Test scanning the same system twice doesn't duplicate capabilities."""
+        order_service = sample_manifests[0]
+        result = export_json([order_service, order_service])
+
+        cap_nodes = [n for n in result["nodes"] if n["type"] == "Capability"]
+        provides_edges = [e for e in result["edges"] if e["type"] == "PROVIDES"]
+
+        assert len(cap_nodes) == 1
+        assert len(provides_edges) == 1
+        assert result["meta"]["capabilities_count"] == 1
+
     def test_export_includes_security_extension(self, security_manifest):
         """Test security extension is included in capability nodes."""
         result = export_json([security_manifest])
@@ -141,6 +166,34 @@ class TestExportJson:
         assert "contain" in containment_node["x_security"]["actions"]
 
 
+@pytest.mark.skipif(msgspec is None, reason="msgspec not installed")
+class TestExportJsonBytes:
+    """Tests that the msgspec fast path stays in sync with export_json."""
+
+    def test_matches_export_json(self, sample_manifests):
+        """Test byte output decodes to the same graph as export_json."""
+        result = json.loads(export_json_bytes(sample_manifests))
+
+        assert result == export_json(sample_manifests)
+
+    def test_matches_with_security_extension(self, security_manifest):
+        """Test x_security capability nodes match between the two paths."""
+        result = json.loads(export_json_bytes([security_manifest]))
+
+        assert result == export_json([security_manifest])
+
+    def test_matches_with_stubs_and_duplicates(self, sample_manifests):
+        """Test stub nodes and capability dedup match between the two paths."""
+        # Repeat a manifest whose dependency target is never defined, so
+        # both the stub-node and dedup branches are exercised
+        order_service = sample_manifests[0]
+        manifests = [order_service, order_service]
+
+        result = json.loads(export_json_bytes(manifests))
+
+        assert result == export_json(manifests)
+
+
 class TestExportMermaid:
     """Tests for Mermaid export."""
 